@@ -1,11 +1,11 @@
 #! /bin/env python
 import os
 import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
-from ...grids import RasterField
-
 
 class BovError(Exception):
     pass
@@ -59,28 +59,166 @@ _BOV_TO_NP_TYPE = {
     "FLOAT": "float32",
     "DOUBLE": "float64",
 }
-_NP_TO_BOV_TYPE = dict(zip(_BOV_TO_NP_TYPE.values(), _BOV_TO_NP_TYPE.keys()))
+_NP_TO_BOV_TYPE = {}
+for _bov_type, _np_type in _BOV_TO_NP_TYPE.items():
+    _dtype = np.dtype(_np_type)
+    _NP_TO_BOV_TYPE[_np_type] = _bov_type
+    _NP_TO_BOV_TYPE[_dtype.str] = _bov_type
+    _NP_TO_BOV_TYPE[_dtype.newbyteorder().str] = _bov_type
+    _NP_TO_BOV_TYPE[_dtype.kind + str(_dtype.itemsize)] = _bov_type
+del _bov_type, _np_type, _dtype
+
 _SYS_TO_BOV_ENDIAN = {"little": "LITTLE", "big": "BIG"}
+_NP_TO_BOV_ENDIAN = {"<": "LITTLE", ">": "BIG"}
+_BOV_TO_NP_ENDIAN = {"LITTLE": "<", "BIG": ">"}
+_NATIVE_BOV_ENDIAN = _SYS_TO_BOV_ENDIAN[sys.byteorder]
+
+_HEADER_KEYS = (
+    "DATA_FILE",
+    "DATA_SIZE",
+    "BRICK_ORIGIN",
+    "BRICK_SIZE",
+    "DATA_ENDIAN",
+    "DATA_FORMAT",
+    "VARIABLE",
+)
+_HEADER_TEMPLATE = "".join("%s: %%s\n" % key for key in _HEADER_KEYS)
+
+
+_BovHeader = namedtuple(
+    "BovHeader",
+    [
+        "data_size",
+        "brick_origin",
+        "brick_size",
+        "data_format",
+        "data_file",
+        "variable",
+        "centering",
+        "time",
+        "data_endian",
+        "extra",
+    ],
+)
+
+
+class BovHeader(_BovHeader):
+    """Header of a BOV file.
+
+    Fields can also be looked up by their header key (``header["DATA_SIZE"]``),
+    which includes any non-standard keys kept in *extra*. Lookups by key,
+    ``get``, ``in``, ``keys``, ``items`` and ``dict(header)`` behave as they
+    would for a read-only dict of the header. Iterating over the header and
+    ``len`` still act on the underlying tuple, so use ``keys()`` for those.
+    """
+
+    __slots__ = ()
+
+    def __contains__(self, key):
+        if not isinstance(key, str):
+            return super().__contains__(key)
+        return key in self.keys()
+
+    def keys(self):
+        keys = [
+            field.upper()
+            for field in self._fields
+            if field != "extra" and getattr(self, field) is not None
+        ]
+        return keys + list(self.extra)
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def __getitem__(self, key):
+        if not isinstance(key, str):
+            return super().__getitem__(key)
+
+        field = key.lower()
+        if field in self._fields and field != "extra":
+            value = getattr(self, field)
+            if value is None:
+                raise KeyError(key)
+            return value
+        return self.extra[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
 
 def array_to_str(array):
-    s = [str(x) for x in array]
-    return " ".join(s)
+    return " ".join(np.asarray(array).astype(str))
+
+
+def _format_bov_header(values, options=None):
+    if not options:
+        return _HEADER_TEMPLATE % values
+
+    extra = dict(options)
+    values = tuple(extra.pop(key, value) for key, value in zip(_HEADER_KEYS, values))
+    return _HEADER_TEMPLATE % values + "".join(
+        "%s: %s\n" % item for item in extra.items()
+    )
+
+
+def _parse_header_vectors(header):
+    return (
+        np.fromstring(header["DATA_SIZE"], dtype=np.int64, sep=" "),
+        np.fromstring(header["BRICK_ORIGIN"], dtype=np.float64, sep=" "),
+        np.fromstring(header["BRICK_SIZE"], dtype=np.float64, sep=" "),
+    )
+
+
+def _read_part(filename, data_type, mmap=True):
+    try:
+        if mmap:
+            return np.memmap(filename, dtype=data_type, mode="r")
+        else:
+            return np.fromfile(filename, dtype=data_type)
+    except OSError:
+        raise ReadError(filename)
+
+
+def fromfile(filename, allow_singleton=True, mmap=False, template=None):
+    """
+    Read a BOV file into a uniform rectilinear grid.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the BOV header file.
+    allow_singleton : boolean, optional
+        If `False`, drop dimensions of length one.
+    mmap : boolean, optional
+        If `True`, memory-map the data file rather than reading it. The
+        field is then a read-only `numpy.memmap` backed by the file on disk,
+        and only the parts that are accessed are read. Bricks split across
+        several files (listed under ``DATA_FILES``) are always read
+        completely into memory, since their parts are joined into one array.
+    template : RasterField, optional
+        Grid whose geometry matches that of the file. The returned grid is a
+        new instance that shares the template's coordinate arrays (which
+        should then be treated as read-only) but none of its fields. This
+        saves rebuilding the coordinates when reading a series of same-sized
+        bricks; the template itself is left unchanged.
 
+    Returns
+    -------
+    tuple of (RasterField, BovHeader)
+        The grid, with the file's variable as a field, and the header.
+    """
+    with open(filename, "rb") as f:
+        text = f.read().decode()
 
-def fromfile(filename, allow_singleton=True):
     header = {}
-    with open(filename, "r") as f:
-        for line in f:
-            try:
-                (data, _) = line.split("#")
-            except ValueError:
-                data = line
-            try:
-                (key, value) = data.split(":")
-                header[key.strip()] = value.strip()
-            except ValueError:
-                pass
+    for line in text.splitlines():
+        data, _, _ = line.partition("#")
+        key, sep, value = data.partition(":")
+        if sep:
+            header[key.strip()] = value.strip()
 
     keys_found = set(header.keys())
     keys_required = {
@@ -95,14 +233,11 @@ def fromfile(filename, allow_singleton=True):
         missing = ", ".join(keys_required - keys_found)
         raise MissingRequiredKeyError(missing)
 
-    shape = header["DATA_SIZE"].split()
-    header["DATA_SIZE"] = np.array([int(i) for i in shape], dtype=np.int64)
-
-    origin = header["BRICK_ORIGIN"].split()
-    header["BRICK_ORIGIN"] = np.array([float(i) for i in origin], dtype=np.float64)
-
-    size = header["BRICK_SIZE"].split()
-    header["BRICK_SIZE"] = np.array([float(i) for i in size], dtype=np.float64)
+    (
+        header["DATA_SIZE"],
+        header["BRICK_ORIGIN"],
+        header["BRICK_SIZE"],
+    ) = _parse_header_vectors(header)
 
     if not allow_singleton:
         not_singleton = header["DATA_SIZE"] > 1
@@ -116,58 +251,91 @@ def fromfile(filename, allow_singleton=True):
     except KeyError:
         raise BadKeyValueError("DATA_FORMAT", type_str)
 
-    dat_file = header["DATA_FILE"]
-    if not os.path.isabs(dat_file):
-        dat_file = os.path.join(os.path.dirname(filename), dat_file)
-
-    try:
-        data = np.fromfile(dat_file, dtype=data_type)
-    except Exception:
-        raise
+    if "DATA_ENDIAN" in header:
+        try:
+            byteorder = _BOV_TO_NP_ENDIAN[header["DATA_ENDIAN"]]
+        except KeyError:
+            raise BadKeyValueError("DATA_ENDIAN", header["DATA_ENDIAN"])
+        data_type = np.dtype(data_type).newbyteorder(byteorder)
 
-    try:
-        data.shape = header["DATA_SIZE"]
-    except ValueError:
+    if "DATA_FILES" in header:
+        dat_files = header["DATA_FILES"].split()
+    else:
+        dat_files = [header["DATA_FILE"]]
+    dat_files = [
+        (
+            dat_file
+            if os.path.isabs(dat_file)
+            else os.path.join(os.path.dirname(filename), dat_file)
+        )
+        for dat_file in dat_files
+    ]
+
+    shape = tuple(int(n) for n in header["DATA_SIZE"])
+    itemsize = np.dtype(data_type).itemsize
+    n_bytes = 0
+    for dat_file in dat_files:
+        try:
+            n_bytes += os.path.getsize(dat_file)
+        except OSError:
+            raise ReadError(dat_file)
+
+    if n_bytes != np.prod(shape) * itemsize:
         raise BadKeyValueError(
-            "DATA_SIZE", "%d != %d" % (np.prod(header["DATA_SIZE"]), data.size)
+            "DATA_SIZE", "%d != %d" % (np.prod(shape), n_bytes // itemsize)
         )
 
-    try:
+    parts = [_read_part(dat_file, data_type, mmap=mmap) for dat_file in dat_files]
+    if len(parts) > 1:
+        data = np.concatenate(parts).reshape(shape)
+    else:
+        data = parts[0].reshape(shape)
+
+    if "TIME" in header:
         header["TIME"] = float(header["TIME"])
-    except KeyError:
-        pass
 
-    shape = header["DATA_SIZE"]
-    origin = header["BRICK_ORIGIN"]
-    spacing = header["BRICK_SIZE"] / (shape - 1)
+    header = BovHeader(
+        data_size=header.pop("DATA_SIZE"),
+        brick_origin=header.pop("BRICK_ORIGIN"),
+        brick_size=header.pop("BRICK_SIZE"),
+        data_format=header.pop("DATA_FORMAT"),
+        data_file=header.pop("DATA_FILE"),
+        variable=header.pop("VARIABLE"),
+        centering=header.pop("CENTERING", None),
+        time=header.pop("TIME", None),
+        data_endian=header.pop("DATA_ENDIAN", None),
+        extra=header,
+    )
 
-    grid = RasterField(shape, spacing, origin, indexing="ij")
-    if "CENTERING" in header and header["CENTERING"] == "zonal":
-        grid.add_field(header["VARIABLE"], data, centering="zonal")
-    else:
-        grid.add_field(header["VARIABLE"], data, centering="point")
+    spacing = header.brick_size / (header.data_size - 1)
 
-    return grid, header
+    if template is None:
+        from pymt.grids import RasterField
 
+        grid = RasterField(
+            header.data_size, spacing, header.brick_origin, indexing="ij"
+        )
+    elif not (
+        np.array_equal(template.get_shape(), header.data_size)
+        and np.allclose(template.get_spacing(), spacing)
+        and np.allclose(template.get_origin(), header.brick_origin)
+    ):
+        raise ValueError("%s: template does not match the file's geometry" % filename)
+    else:
+        grid = template.copy_without_fields()
 
-def array_tofile(
-    filename,
-    array,
-    name="",
-    spacing=(1.0, 1.0),
-    origin=(0.0, 0.0),
-    no_clobber=False,
-    options=None,
-):
-    options = options or {}
+    if header.centering == "zonal":
+        grid.add_field(header.variable, data, centering="zonal")
+    else:
+        grid.add_field(header.variable, data, centering="point")
 
-    (base, ext) = os.path.splitext(filename)
-    if len(ext) > 0 and ext != ".bov":
-        raise BadFileExtension(ext)
+    return grid, header
 
+
+def _brick_header(shape, spacing, origin):
     spacing = np.array(spacing, dtype=np.float64)
     origin = np.array(origin, dtype=np.float64)
-    shape = np.array(array.shape, dtype=np.int64)
+    shape = np.array(shape, dtype=np.int64)
     size = shape * spacing
 
     if len(shape) < 3:
@@ -177,37 +345,126 @@ def array_tofile(
     if len(size) < 3:
         size = np.append(size, [1.0] * (3 - len(size)))
 
+    return array_to_str(shape), array_to_str(origin), array_to_str(size)
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_WRITE_BLOCK_SIZE = 1 << 22
+
+
+def _write_part(filename, array):
+    buffer = memoryview(np.ascontiguousarray(array).reshape(-1).view(np.uint8))
+
+    # Write to a temporary file and move it into place so that arrays still
+    # memory-mapped from a previous version of *filename* keep their data.
+    tmp_file = "%s.%d.tmp" % (filename, os.getpid())
+    fd = os.open(tmp_file, _WRITE_FLAGS, 0o666)
+    try:
+        try:
+            written = 0
+            while written < len(buffer):
+                block = buffer[written : written + _WRITE_BLOCK_SIZE]
+                written += os.write(fd, block)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, filename)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def _split_array(array):
+    n_parts = max(min(os.cpu_count() or 1, len(array)), 1)
+    return np.array_split(array, n_parts, axis=0)
+
+
+def _write_parts(filenames, parts):
+    if len(parts) == 1:
+        _write_part(filenames[0], parts[0])
+    else:
+        with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+            list(executor.map(_write_part, filenames, parts))
+
+
+def _brick_tofile(
+    filename,
+    array,
+    brick,
+    name="",
+    no_clobber=False,
+    options=None,
+    chunk_threshold=None,
+):
+    (base, ext) = os.path.splitext(filename)
+    if len(ext) > 0 and ext != ".bov":
+        raise BadFileExtension(ext)
+
     dat_file = "%s.dat" % base
     bov_file = "%s.bov" % base
 
+    if chunk_threshold is not None and array.nbytes > chunk_threshold:
+        parts = _split_array(array)
+        dat_files = ["%s.part%d" % (dat_file, i) for i in range(len(parts))]
+    else:
+        parts = [array]
+        dat_files = [dat_file]
+
     if no_clobber:
-        if os.path.isfile(bov_file):
-            raise FileExists(bov_file)
-        if os.path.isfile(dat_file):
-            raise FileExists(dat_file)
-
-    array.tofile(dat_file)
-
-    header = dict(
-        DATA_FILE=dat_file,
-        DATA_SIZE=array_to_str(shape),
-        BRICK_ORIGIN=array_to_str(origin),
-        BRICK_SIZE=array_to_str(size),
-        DATA_ENDIAN=_SYS_TO_BOV_ENDIAN[sys.byteorder],
-        DATA_FORMAT=_NP_TO_BOV_TYPE[str(array.dtype)],
-        VARIABLE=name,
+        for path in [bov_file] + dat_files:
+            if os.path.isfile(path):
+                raise FileExists(path)
+
+    _write_parts(dat_files, parts)
+
+    if len(dat_files) > 1:
+        options = dict(options or {}, DATA_FILES=" ".join(dat_files))
+
+    header = _format_bov_header(
+        (dat_files[0],)
+        + brick
+        + (
+            _NP_TO_BOV_ENDIAN.get(array.dtype.byteorder, _NATIVE_BOV_ENDIAN),
+            _NP_TO_BOV_TYPE[array.dtype.str],
+            name,
+        ),
+        options=options,
     )
-
-    header.update(options)
-
     with open(bov_file, "w") as f:
-        for item in header.items():
-            f.write("%s: %s\n" % item)
+        f.write(header)
 
     return bov_file
 
 
-def tofile(filename, grid, var_name=None, no_clobber=False, options=None):
+def array_tofile(
+    filename,
+    array,
+    name="",
+    spacing=(1.0, 1.0),
+    origin=(0.0, 0.0),
+    no_clobber=False,
+    options=None,
+    chunk_threshold=None,
+):
+    return _brick_tofile(
+        filename,
+        array,
+        _brick_header(array.shape, spacing, origin),
+        name=name,
+        no_clobber=no_clobber,
+        options=options,
+        chunk_threshold=chunk_threshold,
+    )
+
+
+def tofile(
+    filename,
+    grid,
+    var_name=None,
+    no_clobber=False,
+    options=None,
+    chunk_threshold=None,
+):
     """
     Write a grid-like object to a BOV file.
 
@@ -223,6 +480,10 @@ def tofile(filename, grid, var_name=None, no_clobber=False, options=None):
         If `True`, and the output file exists, clobber it.
     options : dict
         Additional options to include in the header.
+    chunk_threshold : int, optional
+        If given, fields larger than this many bytes are split along their
+        first dimension and written in parallel to several data files,
+        which are listed under the header's ``DATA_FILES`` key.
 
     Returns
     -------
@@ -258,17 +519,19 @@ def tofile(filename, grid, var_name=None, no_clobber=False, options=None):
     else:
         filenames = [filename]
 
+    brick = _brick_header(shape, spacing, origin)
+
     files_written = []
     for (name, filename) in zip(names, filenames):
         vals = grid.get_field(name).reshape(shape)
-        bov_file = array_tofile(
+        bov_file = _brick_tofile(
             filename,
             vals,
+            brick,
             name=name,
-            spacing=spacing,
-            origin=origin,
             no_clobber=no_clobber,
             options=options,
+            chunk_threshold=chunk_threshold,
         )
 
         files_written.append(bov_file)
@@ -0,0 +1,249 @@
+#! /usr/bin/env python
+# Like the rest of deprecated/, these tests are not collected by pytest (see
+# testpaths in pyproject.toml). They import the BOV module from its former
+# location, pymt.printers.bov, so they run only if it is installed there.
+import os
+
+import numpy as np
+import pytest
+
+from pymt.grids import RasterField
+from pymt.printers.bov.bov_io import (
+    BadKeyValueError,
+    BovHeader,
+    MissingRequiredKeyError,
+    ReadError,
+    fromfile,
+    tofile,
+)
+
+
+def test_round_trip(tmpdir):
+    grid = RasterField((3, 4), (1.0, 2.0), (0.0, 1.0))
+    point_data = np.arange(grid.get_point_count(), dtype=float)
+    grid.add_field("var_0", point_data, centering="point")
+
+    with tmpdir.as_cwd():
+        tofile("test-2d", grid)
+        field, header = fromfile("test-2d.bov", allow_singleton=False)
+
+    assert header["VARIABLE"] == "var_0"
+    assert header["DATA_FORMAT"] == "DOUBLE"
+    assert np.all(header["DATA_SIZE"] == [3, 4])
+    assert np.all(header["BRICK_ORIGIN"] == [0.0, 1.0])
+    assert np.all(header["BRICK_SIZE"] == [3.0, 8.0])
+    assert np.all(field.get_field("var_0") == point_data)
+
+
+def test_header_comments(tmpdir):
+    with tmpdir.as_cwd():
+        np.arange(6, dtype=np.float32).tofile("test.dat")
+        with open("test.bov", "w") as fp:
+            fp.write(
+                """# A BOV header with comments
+DATA_FILE: test.dat  # relative to the header
+  DATA_SIZE : 2 3 1
+BRICK_ORIGIN: 0.0 0.0 0.0
+BRICK_SIZE: 1.0 2.0 1.0
+DATA_FORMAT: FLOAT
+VARIABLE: var_0
+not a key-value pair
+"""
+            )
+        field, header = fromfile("test.bov", allow_singleton=False)
+
+    assert header["DATA_FILE"] == "test.dat"
+    assert np.all(header["DATA_SIZE"] == [2, 3])
+    assert np.all(field.get_field("var_0") == np.arange(6))
+
+
+def test_missing_key(tmpdir):
+    with tmpdir.as_cwd():
+        with open("test.bov", "w") as fp:
+            fp.write("DATA_FILE: test.dat\n")
+        with pytest.raises(MissingRequiredKeyError):
+            fromfile("test.bov")
+
+
+@pytest.mark.parametrize("mmap", (True, False))
+def test_mmap(tmpdir, mmap):
+    grid = RasterField((3, 4), (1.0, 1.0), (0.0, 0.0))
+    point_data = np.arange(grid.get_point_count(), dtype=float)
+    grid.add_field("var_0", point_data, centering="point")
+
+    with tmpdir.as_cwd():
+        tofile("test-2d", grid)
+        field, _ = fromfile("test-2d.bov", allow_singleton=False, mmap=mmap)
+        data = field.get_field("var_0")
+
+        assert isinstance(data, np.memmap) == mmap
+        assert np.all(data == point_data)
+
+
+def test_bad_data_size(tmpdir):
+    grid = RasterField((3, 4), (1.0, 1.0), (0.0, 0.0))
+    grid.add_field("var_0", np.arange(grid.get_point_count()), centering="point")
+
+    with tmpdir.as_cwd():
+        tofile("test-2d", grid)
+        with open("test-2d.dat", "ab") as fp:
+            fp.write(b"extra")
+        with pytest.raises(BadKeyValueError):
+            fromfile("test-2d.bov")
+
+
+@pytest.mark.parametrize("mmap", (True, False))
+def test_chunked(tmpdir, monkeypatch, mmap):
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+
+    grid = RasterField((5, 4), (1.0, 1.0), (0.0, 0.0))
+    point_data = np.arange(grid.get_point_count(), dtype=float)
+    grid.add_field("var_0", point_data, centering="point")
+
+    with tmpdir.as_cwd():
+        tofile("test-2d", grid, chunk_threshold=0)
+        field, header = fromfile("test-2d.bov", allow_singleton=False, mmap=mmap)
+
+        assert header["DATA_FILE"] == "test-2d.dat.part0"
+        dat_files = header["DATA_FILES"].split()
+        assert len(dat_files) == 4
+        for dat_file in dat_files:
+            assert os.path.isfile(dat_file)
+        assert np.all(field.get_field("var_0") == point_data)
+
+
+def test_header_fields(tmpdir):
+    grid = RasterField((3, 4), (1.0, 1.0), (0.0, 0.0))
+    grid.add_field("var_0", np.arange(grid.get_point_count()), centering="point")
+
+    with tmpdir.as_cwd():
+        tofile("test-2d", grid, options={"TIME": 1.5, "foo": "bar"})
+        _, header = fromfile("test-2d.bov", allow_singleton=False)
+
+    assert isinstance(header, BovHeader)
+    assert header.variable == header["VARIABLE"] == "var_0"
+    assert header.data_format == "INT"
+    assert header.time == header["TIME"] == 1.5
+    assert np.all(header.data_size == [3, 4])
+    assert header["foo"] == "bar"
+    assert header.get("CENTERING") is None
+    with pytest.raises(KeyError):
+        header["CENTERING"]
+
+
+def test_header_as_dict(tmpdir):
+    grid = RasterField((3, 4), (1.0, 1.0), (0.0, 0.0))
+    grid.add_field("var_0", np.arange(grid.get_point_count()), centering="point")
+
+    with tmpdir.as_cwd():
+        tofile("test-2d", grid, options={"foo": "bar"})
+        _, header = fromfile("test-2d.bov", allow_singleton=False)
+
+    assert "VARIABLE" in header
+    assert "foo" in header
+    assert "CENTERING" not in header
+    assert set(header.keys()) == {
+        "DATA_SIZE",
+        "BRICK_ORIGIN",
+        "BRICK_SIZE",
+        "DATA_FORMAT",
+        "DATA_FILE",
+        "VARIABLE",
+        "DATA_ENDIAN",
+        "foo",
+    }
+    assert dict(header)["VARIABLE"] == "var_0"
+    assert dict(header.items()).keys() == dict(header).keys()
+
+
+def test_missing_data_file(tmpdir):
+    grid = RasterField((3, 4), (1.0, 1.0), (0.0, 0.0))
+    grid.add_field("var_0", np.arange(grid.get_point_count()), centering="point")
+
+    with tmpdir.as_cwd():
+        tofile("test-2d", grid)
+        os.remove("test-2d.dat")
+        with pytest.raises(ReadError):
+            fromfile("test-2d.bov")
+
+
+def test_template(tmpdir):
+    grid = RasterField((3, 4), (1.0, 1.0), (0.0, 0.0))
+    grid.add_field("var_0", np.arange(12.0), centering="point")
+
+    with tmpdir.as_cwd():
+        tofile("test-2d_0000", grid)
+        first, _ = fromfile("test-2d_0000.bov", allow_singleton=False)
+
+        grid.add_field("var_0", np.arange(12.0) * 10, centering="point")
+        tofile("test-2d_0001", grid)
+        second, _ = fromfile("test-2d_0001.bov", allow_singleton=False, template=first)
+
+        assert second is not first
+        assert np.shares_memory(second.get_x(), first.get_x())
+        assert np.all(first.get_field("var_0") == np.arange(12.0))
+        assert np.all(second.get_field("var_0") == np.arange(12.0) * 10)
+
+
+def test_template_mismatch(tmpdir):
+    grid = RasterField((3, 4), (1.0, 1.0), (0.0, 0.0))
+    grid.add_field("var_0", np.arange(12.0), centering="point")
+
+    with tmpdir.as_cwd():
+        tofile("test-2d", grid)
+        with pytest.raises(ValueError):
+            fromfile(
+                "test-2d.bov",
+                allow_singleton=False,
+                template=RasterField((4, 3), (1.0, 1.0), (0.0, 0.0)),
+            )
+
+
+@pytest.mark.parametrize("mmap", (True, False))
+def test_unreadable_data_file(tmpdir, monkeypatch, mmap):
+    grid = RasterField((3, 4), (1.0, 1.0), (0.0, 0.0))
+    grid.add_field("var_0", np.arange(grid.get_point_count()), centering="point")
+
+    def permission_denied(filename, *args, **kwds):
+        raise PermissionError(filename)
+
+    with tmpdir.as_cwd():
+        tofile("test-2d", grid)
+        monkeypatch.setattr(np, "memmap", permission_denied)
+        monkeypatch.setattr(np, "fromfile", permission_denied)
+        with pytest.raises(ReadError):
+            fromfile("test-2d.bov", mmap=mmap)
+
+
+@pytest.mark.parametrize("shape", ((3, 4), (2, 2)))
+def test_rewrite_mapped_file(tmpdir, shape):
+    grid = RasterField((3, 4), (1.0, 1.0), (0.0, 0.0))
+    grid.add_field("var_0", np.arange(12.0), centering="point")
+
+    with tmpdir.as_cwd():
+        tofile("test-2d", grid)
+        field, _ = fromfile("test-2d.bov", allow_singleton=False, mmap=True)
+
+        new_grid = RasterField(shape, (1.0, 1.0), (0.0, 0.0))
+        new_grid.add_field(
+            "var_0", np.arange(new_grid.get_point_count()) * 7.0, centering="point"
+        )
+        tofile("test-2d", new_grid)
+
+        data = field.get_field("var_0")
+        assert data.sum() == np.arange(12.0).sum()
+        assert np.all(data == np.arange(12.0))
+        assert sorted(os.listdir(".")) == ["test-2d.bov", "test-2d.dat"]
+
+
+def test_fields_are_writable_by_default(tmpdir):
+    grid = RasterField((3, 4), (1.0, 1.0), (0.0, 0.0))
+    grid.add_field("var_0", np.arange(12.0), centering="point")
+
+    with tmpdir.as_cwd():
+        tofile("test-2d", grid)
+        field, _ = fromfile("test-2d.bov", allow_singleton=False)
+
+    data = field.get_field("var_0")
+    data[0] = 5.0
+    assert not isinstance(data, np.memmap)
@@ -1,4 +1,7 @@
 #! /usr/bin/env python
+# Like the rest of deprecated/, these tests are not collected by pytest (see
+# testpaths in pyproject.toml). They import the BOV module from its former
+# location, pymt.printers.bov, so they run only if it is installed there.
 import os
 import sys
 
@@ -7,7 +10,7 @@ import pytest
 import yaml
 
 from pymt.grids import RasterField, RectilinearField
-from pymt.printers.bov.bov_io import FileExists, tofile
+from pymt.printers.bov.bov_io import FileExists, array_tofile, fromfile, tofile
 
 
 def test_1d(tmpdir):
@@ -160,3 +163,86 @@ def test_bad_grid(tmpdir):
     with tmpdir.as_cwd():
         with pytest.raises(TypeError):
             tofile("test-1d", grid)
+
+
+@pytest.mark.parametrize("byteorder", ("<", ">"))
+def test_byteorder(tmpdir, byteorder):
+    array = np.arange(12, dtype=byteorder + "f4")
+
+    with tmpdir.as_cwd():
+        array_tofile("test-1d", array, name="var_0")
+
+        with open("test-1d.bov", "r") as fp:
+            header = yaml.safe_load(fp)
+
+        field, _ = fromfile("test-1d.bov", allow_singleton=False)
+        data = field.get_field("var_0")
+
+    assert header["DATA_FORMAT"] == "FLOAT"
+    assert header["DATA_ENDIAN"] == {"<": "LITTLE", ">": "BIG"}[byteorder]
+    assert np.all(data == np.arange(12))
+
+
+def test_options_override(tmpdir):
+    array = np.arange(12.0)
+
+    with tmpdir.as_cwd():
+        array_tofile("test-1d", array, name="var_0", options={"VARIABLE": "var_1"})
+
+        with open("test-1d.bov", "r") as fp:
+            lines = fp.readlines()
+
+    assert "VARIABLE: var_1\n" in lines
+    assert "VARIABLE: var_0\n" not in lines
+
+
+def test_non_contiguous(tmpdir):
+    array = np.arange(12.0).reshape((3, 4)).T
+
+    with tmpdir.as_cwd():
+        array_tofile("test-2d", array, name="var_0")
+        data = np.fromfile("test-2d.dat", dtype=float)
+
+    assert np.all(data == array.flatten())
+
+
+def test_chunked_no_clobber(tmpdir, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    array = np.arange(12.0).reshape((4, 3))
+
+    with tmpdir.as_cwd():
+        with open("test-2d.dat.part1", "w") as fp:
+            fp.write("empty_file")
+        with pytest.raises(FileExists):
+            array_tofile("test-2d", array, no_clobber=True, chunk_threshold=0)
+        assert not os.path.isfile("test-2d.dat.part0")
+
+
+def test_chunked_options(tmpdir, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    array = np.arange(12.0).reshape((4, 3))
+
+    with tmpdir.as_cwd():
+        array_tofile(
+            "test-2d",
+            array,
+            chunk_threshold=0,
+            options={"DATA_FILES": "stale.dat", 1: "one"},
+        )
+        with open("test-2d.bov", "r") as fp:
+            lines = fp.readlines()
+
+    assert "DATA_FILES: test-2d.dat.part0 test-2d.dat.part1\n" in lines
+    assert "1: one\n" in lines
+
+
+def test_file_mode_follows_umask(tmpdir):
+    umask = os.umask(0o002)
+    try:
+        with tmpdir.as_cwd():
+            array_tofile("test-1d", np.arange(12.0))
+            mode = os.stat("test-1d.dat").st_mode & 0o777
+    finally:
+        os.umask(umask)
+
+    assert mode == 0o664
@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 
 from .igrid import CENTERING_CHOICES, CenteringValueError, DimensionError, IField
@@ -125,6 +127,22 @@ class GridField(Unstructured, IField):
     def has_field(self, name):
         return name in self._fields
 
+    def copy_without_fields(self):
+        """Copy of the grid that has no fields.
+
+        The copy shares the grid's coordinate and connectivity arrays, which
+        should be treated as read-only, but has its own attributes and
+        coordinate units and names.
+        """
+        grid = copy.copy(self)
+        grid._attrs = dict(self._attrs)
+        grid._units = self._units.copy()
+        grid._coordinate_name = self._coordinate_name.copy()
+        grid._fields = {}
+        grid._field_units = {}
+        grid._field_times = {}
+        return grid
+
 
 class UnstructuredField(GridField):
     pass
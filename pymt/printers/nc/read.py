@@ -24,35 +24,43 @@ _NETCDF_READERS = {
 }
 
 
-def query_netcdf_mesh_type(path, fmt="NETCDF4"):
-    root = open_netcdf(path, mode="r", fmt=fmt)
-
+def _query_mesh_type(root):
     try:
         type_string = root.variables["mesh"].type
     except AttributeError:
         raise AttributeError("netcdf file is missing type attribute")
     except KeyError:
         raise AttributeError("netcdf file is missing mesh attribute")
-    finally:
-        root.close()
 
     try:
         mesh_type = _NETCDF_MESH_TYPE[type_string]
     except KeyError:
-        raise TypeError("%s: mesh type not understood" % mesh_type)
+        raise TypeError("%s: mesh type not understood" % type_string)
 
     return mesh_type
 
 
-def field_fromfile(path, fmt="NETCDF4"):
-    mesh_type = query_netcdf_mesh_type(path)
+def query_netcdf_mesh_type(path, fmt="NETCDF4"):
+    root = open_netcdf(path, mode="r", fmt=fmt)
+    try:
+        return _query_mesh_type(root)
+    finally:
+        root.close()
+
 
+def field_fromfile(path, fmt="NETCDF4"):
+    root = open_netcdf(path, mode="r", fmt=fmt)
     try:
-        reader = _NETCDF_READERS[str(mesh_type)]
-    except KeyError:
-        raise TypeError("%s: no reader available for file" % mesh_type)
+        mesh_type = _query_mesh_type(root)
+        try:
+            reader = _NETCDF_READERS[str(mesh_type)]
+        except KeyError:
+            raise TypeError("%s: no reader available for file" % mesh_type)
+    except Exception:
+        root.close()
+        raise
     else:
-        nc_file = reader(path, fmt=fmt)
+        nc_file = reader(path, fmt=fmt, root=root)
 
     if len(nc_file.times) > 0:
         return (nc_file.fields, nc_file.times)
@@ -8,10 +8,12 @@ from .constants import open_netcdf
 
 
 class NetcdfFieldReader:
-    def __init__(self, path, fmt="NETCDF4"):
+    def __init__(self, path, fmt="NETCDF4", root=None):
         self._path = path
 
-        self._root = open_netcdf(path, mode="r", fmt=fmt)
+        if root is None:
+            root = open_netcdf(path, mode="r", fmt=fmt)
+        self._root = root
         self._topology = self._get_mesh_topology()
         self._field = None
         self._time = []
@@ -181,6 +181,20 @@ class TestRasterField(unittest.TestCase):
 
         self.assertEqual(x.size, data.size)
 
+    def test_copy_without_fields(self):
+        g = RasterField((2, 3), (1, 2), (0, 0), indexing="ij")
+        g.add_field("point_var", np.arange(6), centering="point")
+
+        copy = g.copy_without_fields()
+        self.assertIsNot(copy, g)
+        self.assertFalse(copy.has_field("point_var"))
+        self.assertTrue(np.shares_memory(copy.get_x(), g.get_x()))
+
+        copy.add_field("point_var", np.arange(6) * 2, centering="point")
+        copy.set_x_units("m")
+        self.assert_field_values(g, "point_var", [0, 1, 2, 3, 4, 5])
+        self.assertEqual(g.get_x_units(), "-")
+
     def assert_point_count(self, grid, point_count):
         self.assertEqual(point_count, grid.get_point_count())
 
@@ -1,5 +1,7 @@
 import pytest
 
+import pymt.printers.nc.read as nc_read
+import pymt.printers.nc.ugrid_read as ugrid_read
 from pymt.printers.nc.read import field_fromfile
 
 
@@ -14,3 +16,18 @@ from pymt.printers.nc.read import field_fromfile
 )
 def test_read_netcdf(datadir, filename):
     field_fromfile(datadir / filename, fmt="NETCDF4")
+
+
+def test_read_netcdf_opens_once(datadir, monkeypatch):
+    opened = []
+    open_netcdf = nc_read.open_netcdf
+
+    def counting_open_netcdf(path, **kwds):
+        opened.append(path)
+        return open_netcdf(path, **kwds)
+
+    monkeypatch.setattr(nc_read, "open_netcdf", counting_open_netcdf)
+    monkeypatch.setattr(ugrid_read, "open_netcdf", counting_open_netcdf)
+
+    field_fromfile(datadir / "rectilinear.2d.nc", fmt="NETCDF4")
+    assert opened == [datadir / "rectilinear.2d.nc"]